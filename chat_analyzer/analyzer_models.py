@@ -14,14 +14,15 @@ class ContactType(Enum):
 
     @classmethod
     def get_type_by_local_type_id(cls, local_type: int) -> str:
-        """根据local_type获取对应的类型字符串（适配原有逻辑）"""
-        for member in cls:
-            if member.value[0] == local_type:
-                return member.value[1]
-        return cls.UNKNOWN.value[1]  # 兜底返回unknown
+        """根据local_type获取对应的类型字符串（预构建字典O(1)查找，替代逐成员线性扫描）"""
+        return _CONTACT_TYPE_BY_ID.get(local_type, cls.UNKNOWN.value[1])
 
 
-@dataclass
+# 模块加载时预构建local_type→类型字符串映射（每行联系人都要查，避免热路径线性扫描枚举）
+_CONTACT_TYPE_BY_ID: Dict[int, str] = {member.value[0]: member.value[1] for member in ContactType}
+
+
+@dataclass(slots=True)
 class ContactRecord:
     """映射缓存的单个联系人/群聊缓存对象（替代原嵌套字典）"""
     username: str          # 联系人username
@@ -32,7 +33,7 @@ class ContactRecord:
 
 
 # ============ 聊天记录Record类 ============
-@dataclass
+@dataclass(slots=True)
 class ChatRecordCore:
     """聊天记录核心数据对象,用于回溯记录"""
     local_id: int               # 自增主键
@@ -41,12 +42,12 @@ class ChatRecordCore:
     create_time: int            # 时间戳
     # create_time_format: Optional[datetime] = None  # 格式化时间（可选，兼容空值）
 
-@dataclass
+@dataclass(slots=True)
 class ChatRecordCommon(ChatRecordCore):
     """聊天记录普通对象,对应Msg表（继承核心字段 + 拓展口头禅/上下文字段）"""
     matched_phrases: List[str] = dataclasses.field(default_factory=list)  # 命中的口头禅列表（默认空列表）
 
-@dataclass
+@dataclass(slots=True)
 class ChatRecordExtend(ChatRecordCommon):
     """聊天记录完全对象（继承核心字段 + 拓展口头禅/上下文字段）"""
     context_front_records: List[ChatRecordCore] = dataclasses.field(default_factory=list)  # 上下文记录（默认空列表）
@@ -54,7 +55,7 @@ class ChatRecordExtend(ChatRecordCommon):
 # =========================================
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyzerResult:
     """聚合结果"""
     contact: ContactRecord  # 该表关联的联系人/群聊信息
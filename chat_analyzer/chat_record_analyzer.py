@@ -1,5 +1,5 @@
 import asyncio
-import dataclasses
+import functools
 import hashlib
 import logging
 import re
@@ -20,6 +20,18 @@ from .analyzer_models import (
 
 logger = logging.getLogger(__name__)
 
+# 模块级预编译：匹配以wxid_开头的用户名前缀（包含冒号和可选的换行符）
+# _replace_wxid_content按记录/按上下文条目调用，避免每次进re模块缓存查找
+_WXID_PREFIX_RE = re.compile(r'^(wxid_\w+):\n?')
+
+
+@functools.lru_cache(maxsize=4096)
+def _username_to_table_name(username: str) -> str:
+    """username→Msg表名（MD5计算lru_cache记忆化，多次run()/重复联系人直接命中）"""
+    # hexdigest本身即小写，无需再lower；usedforsecurity=False跳过FIPS校验开销
+    return f"Msg_{hashlib.md5(username.encode(), usedforsecurity=False).hexdigest()}"
+
+
 class ChatRecordAnalyzer:
     """聊天记录分析器（核心业务类）"""
 
@@ -36,6 +48,8 @@ class ChatRecordAnalyzer:
         self.backtracked_front_record: BacktrackedRecordType = {}
         self.backtracked_last_record: BacktrackedRecordType = {}
         self.analyzer_result: List[AnalyzerResult] = []
+        # 缓存：全量联系人username→nickname映射（懒加载，多次run()复用，避免重复全表查询）
+        self._username_nickname_cache: Dict[str, str] | None = None
 
 
     async def run(self) -> List[AnalyzerResult]:
@@ -78,26 +92,26 @@ class ChatRecordAnalyzer:
         if len(contact_result) == 0:
             raise ContactNotFoundError(target_value)
 
-        # 提取查询结果中实际匹配到的名称集合
+        # 实际匹配到的名称集合（与映射构建在下方共用同一次遍历，省去单独扫一遍contact_result）
         matched_names = set()
-        for info in contact_result:
-            if info["remark"]:
-                matched_names.add(info["remark"].strip())
-            if info["nick_name"]:
-                matched_names.add(info["nick_name"].strip())
-        # 筛选配置值中未匹配到的项
-        unmatched_config_values = [val for val in target_value if val.strip() not in matched_names]
-        # ========== 新增逻辑结束 ==========
-
-        # 3. 遍历所有联系人结果，逐个处理并存入缓存（核心修改：从单元素改为循环）
+
+        # 3. 遍历所有联系人结果，单次遍历同时收集匹配名称+构建映射缓存
+        total_contacts = len(contact_result)  # 循环不变量提前计算
         for idx, contact_info in enumerate(contact_result, 1):
+            # 3.0 收集本行实际匹配到的名称（用于后续未匹配项计算）
+            remark = contact_info["remark"]
+            nick_name = contact_info["nick_name"]
+            if remark:
+                matched_names.add(remark.strip())
+            if nick_name:
+                matched_names.add(nick_name.strip())
+
             # 3.1 提取username并生成MD5表名
             username = contact_info["username"]
-            md5_username = hashlib.md5(username.encode()).hexdigest().lower()
-            target_table_name = f"Msg_{md5_username}"
+            target_table_name = _username_to_table_name(username)
 
             # 3.2 构造联系人信息（兼容remark/nick_name为空的情况）
-            contact_name = contact_info["remark"] or contact_info["nick_name"] or "未知联系人"
+            contact_name = remark or nick_name or "未知联系人"
 
             local_type = contact_info["local_type"]
             contact_type = ContactType.get_type_by_local_type_id(local_type)
@@ -110,18 +124,20 @@ class ChatRecordAnalyzer:
                 type_code=local_type
             )
 
+            # 循环内日志用%懒格式化，日志级别不启用时不做字符串拼接
             logger.info(
-                f"🎷 【映射缓存-{idx}/{len(contact_result)}】"
-                f"联系人名称：{contact_name} | "
-                f"类型：{contact_type}（原始local_type：{local_type}） | "
-                f"username：{username} | "
-                f"生成目标表名：{target_table_name}"
+                "🎷 【映射缓存-%d/%d】联系人名称：%s | 类型：%s（原始local_type：%s） | username：%s | 生成目标表名：%s",
+                idx, total_contacts, contact_name, contact_type, local_type, username, target_table_name
             )
 
+        # 筛选配置值中未匹配到的项（C级集合差集一步算出，再映射回原始拼写用于告警日志）
+        stripped_targets = {val.strip(): val for val in target_value}
+        unmatched_config_values = [stripped_targets[s] for s in stripped_targets.keys() - matched_names]
+
         # ========== 未匹配日志（对齐_get_pending_tables风格） ==========
         if unmatched_config_values:
             for val in unmatched_config_values:
-                logger.warning(f"⚠️ 配置值[{val}]未在联系人表中匹配到对应的联系人/群聊")
+                logger.warning("⚠️ 配置值[%s]未在联系人表中匹配到对应的联系人/群聊", val)
 
         logger.info(
             f"🎷 【映射缓存汇总】配置目标值总数：{len(target_value)} | "
@@ -161,14 +177,15 @@ class ChatRecordAnalyzer:
             total_records = table_seq_dict[table_name]
             contact_info = self.mapping_cache[table_name]
             logger.info(
-                f"🎸 联系人[{contact_info.nickname}]的目标表[{table_name}]存在，该表总聊天记录数：{total_records}条"
+                "🎸 联系人[%s]的目标表[%s]存在，该表总聊天记录数：%s条",
+                contact_info.nickname, table_name, total_records
             )
             valid_tables.append(table_name)
 
         # 日志记录缺失的联系人
         if missing_contacts:
             for missing_info in missing_contacts:
-                logger.warning(f"⚠️ {missing_info}")
+                logger.warning("⚠️ %s", missing_info)
 
         # 所有表都缺失→抛异常；部分缺失仅日志，返回有效表名
         if not valid_tables:
@@ -203,17 +220,16 @@ class ChatRecordAnalyzer:
         pet_phrase_config = self.app_config.pet_phrase_config
         max_concurrency = self.app_config.db_config.max_concurrency
 
-        # 1. 构建时间条件（所有表共用）
-        time_condition = SQLBuilder.build_time_condition(self.app_config.time_config)
-        # 2. 构建口头禅条件+参数（所有表共用）
-        phrase_condition, phrase_params = SQLBuilder.build_phrase_condition(pet_phrase_config)
-        # 3. 构建命中关键词列表别名
-        match_keywords_sql, match_params = SQLBuilder.build_match_keywords_sql(pet_phrase_config)
+        # 1. 构建时间条件+参数（依赖当前时刻，仍每次run()构建）
+        time_condition, time_params = SQLBuilder.build_time_condition(self.app_config.time_config)
+        # 2~3. 口头禅条件/命中关键词片段读取解析期预构建结果（ConfigParser已常量折叠）
+        phrase_condition, phrase_params = pet_phrase_config.sql_phrase_condition, pet_phrase_config.sql_phrase_params
+        match_keywords_sql, match_params = pet_phrase_config.sql_match_keywords, pet_phrase_config.sql_match_params
 
         logger.info(
             f"🎹 构建公共查询条件：待处理表数={len(pending_tables)} | "
             f"口头禅列表={pet_phrase_config.pet_phrases}（匹配类型={pet_phrase_config.match_type}） | "
-            f"时间范围={time_condition} | "
+            f"时间范围={time_condition}{time_params} | "
             f"仅查自己消息={True} | "
             f"最大并发数={max_concurrency}"
         )
@@ -221,37 +237,42 @@ class ChatRecordAnalyzer:
         # 创建信号量限制并发数
         semaphore = asyncio.Semaphore(max_concurrency)
 
+        # 提前绑定局部变量（解析期已折算好的布尔字段，避免每个表协程重复解析属性链）
+        only_self_msg = self.app_config.stat_mode.only_self_msg
+
+        # 短语驻留池：split产出的短语串映射回配置里的同一实例，十万级记录只保留一份短语对象
+        phrase_pool = {phrase: phrase for phrase in pet_phrase_config.pet_phrases}
+
         async def process_single_table(tbl_name: str) -> tuple[str, Dict[int, ChatRecordCommon]]:
             """处理单个表的协程函数"""
             async with semaphore:
-                # 1. 调用DB服务获取原始记录（字典列表）
-                raw_records = await ChatRecordDBService.get_chat_records_by_phrase_and_time(
-                    table_name=tbl_name,
-                    phrase_condition=phrase_condition,
-                    phrase_params=phrase_params,
-                    match_keywords_sql=match_keywords_sql,
-                    match_params=match_params,
-                    time_condition=time_condition,
-                    only_self_msg=self.app_config.stat_mode.mode_type != "target_to_self"
-                )
-
-                # 2. 转换为ChatRecord对象（核心：字典→结构化类，改为local_id为key的dict）
+                # 1~2. 流式消费DB服务的原始记录，边读边构造ChatRecord（单批行驻留内存，不全量物化）
+                # 列序与DB服务SELECT约定一致：(local_id, message_content, real_sender_id, create_time, matched_phrases)
                 records_dict = {}  # 初始化改为字典，替代列表
-                for raw in raw_records:
-                    # 匹配ChatRecord字段，补充matched_phrases（空列表兜底）
-                    raw_create_time = raw["create_time"]
-                    raw_matched_phrases = raw["matched_phrases"]
-
+                async for local_id, message_content, real_sender_id, raw_create_time, raw_matched_phrases in \
+                        ChatRecordDBService.get_chat_records_by_phrase_and_time(
+                            table_name=tbl_name,
+                            phrase_condition=phrase_condition,
+                            phrase_params=phrase_params,
+                            match_keywords_sql=match_keywords_sql,
+                            match_params=match_params,
+                            time_condition=time_condition,
+                            time_params=time_params,
+                            only_self_msg=only_self_msg
+                        ):
                     chat_record = ChatRecordCommon(
-                        local_id=raw["local_id"],
-                        message_content=raw["message_content"],
-                        real_sender_id=raw["real_sender_id"],
+                        local_id=local_id,
+                        message_content=message_content,
+                        real_sender_id=real_sender_id,
                         create_time=raw_create_time,
-                        matched_phrases=raw_matched_phrases.split(',') if raw_matched_phrases and raw_matched_phrases.strip() else []
+                        # SQL端CASE拼接保证非空即无空白，省去逐行strip()的临时字符串分配；
+                        # split出的短语经驻留池映射回配置实例，释放每行的临时字符串
+                        matched_phrases=[phrase_pool.get(p, p) for p in raw_matched_phrases.split(',')]
+                        if raw_matched_phrases else []
                     )
-                    records_dict[chat_record.local_id] = chat_record  # 以local_id为key存入字典
+                    records_dict[local_id] = chat_record  # 以local_id为key存入字典
 
-                logger.info(f"🎹 处理表完成：表名={tbl_name} | 有效记录数={len(records_dict.keys())}")
+                logger.info("🎹 处理表完成：表名=%s | 有效记录数=%d", tbl_name, len(records_dict))
                 return tbl_name, records_dict
 
         # 并发处理所有表
@@ -276,6 +297,14 @@ class ChatRecordAnalyzer:
         context_front_limit = self.app_config.pet_phrase_config.context_front_limit
         context_end_limit = self.app_config.pet_phrase_config.context_end_limit
 
+        # 前后追溯条数均为0：整步短路，省去全部ID计算与DB查询
+        if context_front_limit <= 0 and context_end_limit <= 0:
+            logger.info("🎻 上下文追溯条数配置为(前0,后0)，跳过回溯步骤")
+            return (
+                {table_name: {} for table_name in self.process_result.keys()},
+                {table_name: {} for table_name in self.process_result.keys()}
+            )
+
         # 日志埋点（贴合你的风格）
         logger.info(
             f"🎻 开始批量追溯上下文：待处理表数={len(self.process_result)} | "
@@ -289,121 +318,128 @@ class ChatRecordAnalyzer:
         backtrack_front_result: BacktrackedRecordType = {}
         backtrack_last_result: BacktrackedRecordType = {}
 
-        # ========== 核心步骤：按表→核心ID维度，分别处理前/后上下文（并发优化） ==========
-        max_concurrency = self.app_config.db_config.max_concurrency
-        semaphore = asyncio.Semaphore(max_concurrency)
+        # ========== 核心步骤：按表维度批量查询上下文（该表所有核心ID的前/后ID合并为一次IN查询） ==========
+        # 信号量限制并发数，防止耗尽连接池（与_process_tables同款模式）
+        semaphore = asyncio.Semaphore(self.app_config.db_config.max_concurrency)
 
-        async def process_context_for_core_id(
-            tbl_name: str,
-            core_id: int,
-            front_id_list: List[int],
-            last_id_list: List[int]
-        ) -> tuple[str, int, List[ChatRecordCore], List[ChatRecordCore]]:
-            """处理单个核心ID的前后上下文"""
+        async def fetch_one_table(tbl_name: str) -> tuple[str, Dict[int, List[ChatRecordCore]], Dict[int, List[ChatRecordCore]]]:
+            """单表上下文查询协程（带并发限制）"""
             async with semaphore:
-                front_ctx = await self._get_and_convert_context_records(tbl_name, front_id_list)
-                last_ctx = await self._get_and_convert_context_records(tbl_name, last_id_list)
-                return tbl_name, core_id, front_ctx, last_ctx
-
-        # 收集所有需要处理的上下文查询任务
-        context_tasks = []
-        for table_name in self.process_result.keys():
-            # 获取当前表的前/后上下文ID映射
-            table_front_id_map = backtrack_front_id_map.get(table_name, {})
-            table_last_id_map = backtrack_last_id_map.get(table_name, {})
-
-            # 为当前表的每个核心ID创建任务
-            for core_local_id in self.process_result[table_name].keys():
-                front_ids = table_front_id_map.get(core_local_id, [])
-                last_ids = table_last_id_map.get(core_local_id, [])
-                context_tasks.append(
-                    process_context_for_core_id(table_name, core_local_id, front_ids, last_ids)
+                front_res, last_res = await self._fetch_table_context(
+                    tbl_name,
+                    backtrack_front_id_map.get(tbl_name, {}),
+                    backtrack_last_id_map.get(tbl_name, {})
+                )
+                return tbl_name, front_res, last_res
+
+        # 并发执行所有表的批量上下文查询
+        table_results = await asyncio.gather(
+            *(fetch_one_table(table_name) for table_name in self.process_result.keys())
+        )
+        for table_name, table_front_result, table_last_result in table_results:
+            backtrack_front_result[table_name] = table_front_result
+            backtrack_last_result[table_name] = table_last_result
+
+        # ========== 日志：统计回溯结果并输出（单次遍历同时产出各表明细+汇总，仅INFO启用时执行） ==========
+        if logger.isEnabledFor(logging.INFO):
+            total_front_tables = total_front_core_ids = total_front_context = 0
+            total_last_tables = total_last_core_ids = total_last_context = 0
+
+            for table_log_name in self.process_result.keys():
+                front_core_ctx = backtrack_front_result.get(table_log_name, {})
+                last_core_ctx = backtrack_last_result.get(table_log_name, {})
+                front_core_count = len(front_core_ctx)
+                front_ctx_count = sum(len(ctx) for ctx in front_core_ctx.values())
+                last_core_count = len(last_core_ctx)
+                last_ctx_count = sum(len(ctx) for ctx in last_core_ctx.values())
+
+                logger.info(
+                    "🎻 回溯表明细：表名=%s | 前向：核心ID数=%d 上下文记录数=%d | 后向：核心ID数=%d 上下文记录数=%d",
+                    table_log_name, front_core_count, front_ctx_count, last_core_count, last_ctx_count
                 )
 
-        # 并发执行所有上下文查询
-        if context_tasks:
-            context_results = await asyncio.gather(*context_tasks)
-
-            # 初始化所有表的结果字典
-            for table_name in self.process_result.keys():
-                backtrack_front_result[table_name] = {}
-                backtrack_last_result[table_name] = {}
-
-            # 将结果存入对应的表结构
-            for table_name, core_local_id, front_context, last_context in context_results:
-                backtrack_front_result[table_name][core_local_id] = front_context
-                backtrack_last_result[table_name][core_local_id] = last_context
-        else:
-            # 如果没有任务，初始化空结果
-            for table_name in self.process_result.keys():
-                backtrack_front_result[table_name] = {}
-                backtrack_last_result[table_name] = {}
-
-        # ========== 新增日志：统计回溯结果并输出 ==========
-        # 4. 输出各表明细日志（可选，按需开启）
-        for table_log_name in self.process_result.keys():
-            front_core_count = len(backtrack_front_result.get(table_log_name, {}))
-            front_ctx_count = sum(len(ctx) for ctx in backtrack_front_result.get(table_log_name, {}).values())
-            last_core_count = len(backtrack_last_result.get(table_log_name, {}))
-            last_ctx_count = sum(len(ctx) for ctx in backtrack_last_result.get(table_log_name, {}).values())
+                # 顺带累加汇总统计（原实现对同一结果集重复扫描6次）
+                total_front_tables += 1 if front_core_ctx else 0
+                total_front_core_ids += front_core_count
+                total_front_context += front_ctx_count
+                total_last_tables += 1 if last_core_ctx else 0
+                total_last_core_ids += last_core_count
+                total_last_context += last_ctx_count
 
+            # 输出汇总日志
             logger.info(
-                f"🎻 回溯表明细：表名={table_log_name} | "
-                f"前向：核心ID数={front_core_count} 上下文记录数={front_ctx_count} | "
-                f"后向：核心ID数={last_core_count} 上下文记录数={last_ctx_count}"
+                f"🎻 上下文回溯完成 | "
+                f"前向：非空表数={total_front_tables} 核心ID数={total_front_core_ids} 上下文记录数={total_front_context} | "
+                f"后向：非空表数={total_last_tables} 核心ID数={total_last_core_ids} 上下文记录数={total_last_context}"
             )
 
-        # 1. 统计前向回溯数据
-        total_front_tables = len([t for t in backtrack_front_result.values() if t])  # 非空前向表数
-        total_front_core_ids = sum(len(core_ids) for core_ids in backtrack_front_result.values())  # 前向核心ID总数
-        total_front_context = sum(
-            len(ctx) for core_ctx in backtrack_front_result.values() for ctx in core_ctx.values())  # 前向上下文记录总数
-
-        # 2. 统计后向回溯数据
-        total_last_tables = len([t for t in backtrack_last_result.values() if t])  # 非空后向表数
-        total_last_core_ids = sum(len(core_ids) for core_ids in backtrack_last_result.values())  # 后向核心ID总数
-        total_last_context = sum(
-            len(ctx) for core_ctx in backtrack_last_result.values() for ctx in core_ctx.values())  # 后向上下文记录总数
-
-        # 3. 输出汇总日志
-        logger.info(
-            f"🎻 上下文回溯完成 | "
-            f"前向：非空表数={total_front_tables} 核心ID数={total_front_core_ids} 上下文记录数={total_front_context} | "
-            f"后向：非空表数={total_last_tables} 核心ID数={total_last_core_ids} 上下文记录数={total_last_context}"
-        )
-
         return backtrack_front_result, backtrack_last_result
 
     @staticmethod
-    async def _get_and_convert_context_records(table_name: str, context_ids: List[int]) -> List[ChatRecordCore]:
+    async def _fetch_table_context(
+            table_name: str,
+            front_id_map: Dict[int, List[int]],
+            last_id_map: Dict[int, List[int]]
+    ) -> tuple[Dict[int, List[ChatRecordCore]], Dict[int, List[ChatRecordCore]]]:
         """
-        【私有方法】通用上下文记录查询+转换逻辑
+        【私有方法】单表上下文批量查询+分桶还原
+        合并该表所有核心ID的前/后回溯ID为一次IN查询，再按核心local_id分桶，
+        DB调用次数从 2×核心记录数 降为每表1次
         :param table_name: 表名
-        :param context_ids: 需查询的local_id列表
-        :return: 转换后的ChatRecordCore列表（空列表若context_ids为空）
+        :param front_id_map: {核心local_id: 前N条的local_id列表}
+        :param last_id_map: {核心local_id: 后N条的local_id列表}
+        :return: (前上下文结果, 后上下文结果)，均为{核心local_id: ChatRecordCore列表}
         """
-        # 空ID列表直接返回空
-        if not context_ids:
-            return []
+        # 1. 每个核心ID的前/后回溯ID天然连续，折叠为[min,max]区间并归并重叠区间
+        #    （BETWEEN走主键范围扫描，参数量也从每ID一个降为每区间两个）
+        intervals = []
+        for core_id in front_id_map.keys() | last_id_map.keys():
+            context_ids = front_id_map.get(core_id, []) + last_id_map.get(core_id, [])
+            if context_ids:
+                intervals.append((min(context_ids), max(context_ids)))
+
+        # 空区间直接返回空桶（保持每个核心ID都有结果项）
+        if not intervals:
+            return (
+                {core_id: [] for core_id in front_id_map},
+                {core_id: [] for core_id in last_id_map}
+            )
 
-        # 调用批量查询获取原始记录
-        raw_records = await ChatRecordDBService.get_batch_records_by_local_ids(
+        # 归并重叠/相邻区间（相邻核心ID的回溯窗口常有重叠，归并后同一行只查一次）
+        intervals.sort()
+        merged_ranges = [intervals[0]]
+        for lo, hi in intervals[1:]:
+            last_lo, last_hi = merged_ranges[-1]
+            if lo <= last_hi + 1:
+                merged_ranges[-1] = (last_lo, max(last_hi, hi))
+            else:
+                merged_ranges.append((lo, hi))
+
+        # 2. 一次区间批量查询并转换为{local_id: ChatRecordCore}查找表
+        raw_records = await ChatRecordDBService.get_records_by_local_id_ranges(
             table_name=table_name,
-            local_id_set=context_ids
+            id_ranges=merged_ranges
         )
-
-        # 转换为ChatRecordCore列表
-        context_records = [
-            ChatRecordCore(
+        record_by_id = {
+            raw["local_id"]: ChatRecordCore(
                 local_id=raw["local_id"],
                 message_content=raw["message_content"],
                 real_sender_id=raw["real_sender_id"],
                 create_time=raw["create_time"],
             )
             for raw in raw_records
-        ]
-
-        return context_records
+        }
+
+        # 3. 按核心local_id分桶还原前/后上下文（表中不存在的ID自然跳过）
+        table_front_result = {
+            core_id: [record_by_id[cid] for cid in ids if cid in record_by_id]
+            for core_id, ids in front_id_map.items()
+        }
+        table_last_result = {
+            core_id: [record_by_id[cid] for cid in ids if cid in record_by_id]
+            for core_id, ids in last_id_map.items()
+        }
+        return table_front_result, table_last_result
 
     async def _calculate_backtrack_ids(self) -> tuple[Dict[str, Dict[int, List[int]]], Dict[str, Dict[int, List[int]]]]:
         """
@@ -440,20 +476,19 @@ class ChatRecordAnalyzer:
                 # ========== 1. 计算当前核心ID的前N条ID（context_front_limit） ==========
                 front_id_list = []
                 if context_front_limit > 0:
-                    for i in range(1, context_front_limit + 1):
-                        front_id = core_local_id - i
-                        if front_id > 0:  # 过滤负数ID（数据库自增主键无负数）
-                            front_id_list.append(front_id)
-                    front_id_list.sort()  # 升序排列
+                    # 倒序步进（core-N → core-1）生成即升序，无需再sort；过滤非正ID（自增主键无负数）
+                    front_id_list = [
+                        core_local_id - i
+                        for i in range(context_front_limit, 0, -1)
+                        if core_local_id - i > 0
+                    ]
                 table_front_ids[core_local_id] = front_id_list
 
                 # ========== 2. 计算当前核心ID的后N条ID（context_end_limit） ==========
                 last_id_list = []
                 if context_end_limit > 0:
-                    for i in range(1, context_end_limit + 1):
-                        last_id = core_local_id + i
-                        last_id_list.append(last_id)
-                    last_id_list.sort()  # 升序排列
+                    # range(1..N)递增，生成即升序
+                    last_id_list = [core_local_id + i for i in range(1, context_end_limit + 1)]
                 table_last_ids[core_local_id] = last_id_list
 
             # 存入当前表的前/后回溯ID结果
@@ -488,8 +523,13 @@ class ChatRecordAnalyzer:
             if username in self.process_result:
                 for local_id, common_record in self.process_result[username].items():
                     # 转换为扩展记录并初始化上下文
+                    # 直接逐字段取值（dataclasses.asdict会递归深拷贝每个字段，数千条记录下开销可观）
                     extend_record = ChatRecordExtend(
-                        **dataclasses.asdict(common_record),
+                        local_id=common_record.local_id,
+                        message_content=common_record.message_content,
+                        real_sender_id=common_record.real_sender_id,
+                        create_time=common_record.create_time,
+                        matched_phrases=common_record.matched_phrases,
                         context_front_records=[],
                         context_last_records=[]
                     )
@@ -537,27 +577,16 @@ class ChatRecordAnalyzer:
             logger.info("🥁 无群组类型联系人，不执行wxid替换操作")
             return
 
-        # 步骤2: 获取联系人信息并建立映射字典
-        # 假设target_value为None时获取所有联系人，实际使用时请根据需求调整
-        contact_result = ContactDBService.get_contacts(None, False)
-        logger.info(f"🥁 获取到[{len(contact_result)}]条联系人信息用于wxid映射")
-
-        # 构建username到nickname的映射: 优先使用remark，否则使用nick_name
-        username_to_nickname: Dict[str, str] = {}
-        for contact in contact_result:
-            username = contact.get('username')
-            if not username:
-                continue
-            # 优先使用remark，为空则使用nick_name
-            nickname = contact.get('remark') or contact.get('nick_name', username)
-            username_to_nickname[username] = nickname
+        # 步骤2: 获取联系人信息并建立映射字典（懒加载缓存，重复run()不再重查全表）
+        username_to_nickname = self._get_username_nickname_map()
 
-        # 步骤3: 遍历分析结果并执行替换操作
+        # 步骤3: 遍历分析结果并执行替换操作（模式判断提前绑定，避免每条记录重复解析属性链）
+        replace_core_record = self.app_config.stat_mode.mode_type == "target_to_self"
         for analyzer_result in self.analyzer_result:
             # 处理群聊记录中的扩展聊天记录
             for chat_record in analyzer_result.chat_records:
                 # 替换当前聊天记录内容
-                if self.app_config.stat_mode.mode_type == "target_to_self":
+                if replace_core_record:
                     self._replace_wxid_content(chat_record, username_to_nickname)
 
                 # 替换前置上下文记录
@@ -571,6 +600,33 @@ class ChatRecordAnalyzer:
         logger.info("🥁 翻译群聊成员昵称任务完成")
 
 
+    def _get_username_nickname_map(self) -> Dict[str, str]:
+        """
+        【私有方法】获取全量联系人username→nickname映射（实例级懒加载缓存）
+        首次调用查询contact全表并构建映射，后续调用直接命中缓存；
+        若联系人库已知发生变化，将_username_nickname_cache置None即可失效重建
+        """
+        if self._username_nickname_cache is not None:
+            return self._username_nickname_cache
+
+        # 假设target_value为None时获取所有联系人，实际使用时请根据需求调整
+        contact_result = ContactDBService.get_contacts(None, False)
+        logger.info(f"🥁 获取到[{len(contact_result)}]条联系人信息用于wxid映射")
+
+        # 构建username到nickname的映射: 优先使用remark，否则使用nick_name
+        username_to_nickname: Dict[str, str] = {}
+        for contact in contact_result:
+            username = contact.get('username')
+            if not username:
+                continue
+            # 优先使用remark，为空则使用nick_name
+            nickname = contact.get('remark') or contact.get('nick_name', username)
+            username_to_nickname[username] = nickname
+
+        self._username_nickname_cache = username_to_nickname
+        return username_to_nickname
+
+
     @staticmethod
     def _replace_wxid_content(record: ChatRecordExtend | ChatRecordCore, mapping: Dict[str, str]) -> None:
         """
@@ -580,20 +636,21 @@ class ChatRecordAnalyzer:
             return
 
         content = record.message_content
-        # 匹配以wxid_开头的用户名前缀（包含冒号和可选的换行符）
-        match = re.match(r'^(wxid_\w+):\n?', content)
+        # 廉价前置判断：绝大多数记录不以wxid_开头，C级startswith即可排除，省去进正则引擎
+        if not content.startswith('wxid_'):
+            return
 
+        match = _WXID_PREFIX_RE.match(content)
         if not match:
             return
 
         username = match.group(1)
         nickname = mapping.get(username)
         if not nickname:
-            logger.debug(f"⚠️ 未找到wxid[{username}]对应的昵称映射")
+            logger.debug("⚠️ 未找到wxid[%s]对应的昵称映射", username)
 
-        # 执行替换
-        original_prefix = match.group(0)
-        record.message_content = content.replace(original_prefix, f'{nickname}:', 1)
-        logger.debug(f"🥁 wxid替换完成: {username} -> {nickname}")
+        # 执行替换（前缀锚定在开头，直接切片拼接，省去str.replace再扫一遍全文）
+        record.message_content = f'{nickname}:{content[match.end():]}'
+        logger.debug("🥁 wxid替换完成: %s -> %s", username, nickname)
     #endregion
 
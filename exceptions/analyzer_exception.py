@@ -7,14 +7,20 @@ class ContactNotFoundError(AnalyzerBaseException):
     """未找到指定联系人/群聊异常"""
     def __init__(self, target_value: list, message: str = "❌ 未找到指定联系人/群聊"):
         self.target_value = target_value
-        # 拼接完整异常信息（保留默认message+业务参数）
-        full_message = f"{message}：remark或nick_name等于[{target_value}]"
-        super().__init__(full_message)
+        self.message = message
+        super().__init__()
+
+    def __str__(self) -> str:
+        # 完整异常信息推迟到被打印时拼接（保留默认message+业务参数）
+        return f"{self.message}：remark或nick_name等于[{self.target_value}]"
 
 class TargetTableNotFoundError(AnalyzerBaseException):
     """目标表不存在于聊天记录数据库异常"""
     def __init__(self, target_table_name: str, message: str = "❌ 目标表不存在于聊天记录数据库"):
         self.target_table_name = target_table_name
-        # 拼接完整异常信息（保留默认message+业务参数）
-        full_message = f"{message}：{target_table_name}（sqlite_sequence无该表记录）"
-        super().__init__(full_message)
\ No newline at end of file
+        self.message = message
+        super().__init__()
+
+    def __str__(self) -> str:
+        # 完整异常信息推迟到被打印时拼接（保留默认message+业务参数）
+        return f"{self.message}：{self.target_table_name}（sqlite_sequence无该表记录）"
\ No newline at end of file
@@ -23,13 +23,21 @@ class DBPoolExhaustedError(LuckyChatDBError):
     """数据库连接未初始化异常（连接对象为空）"""
     def __init__(self, max_connections:int, message: str = "❌ 连接池已耗尽"):
         self.max_connections = max_connections
-        full_message = f"{message} (最大连接数: {max_connections})"
-        super().__init__(full_message)
+        self.message = message
+        super().__init__()
+
+    def __str__(self) -> str:
+        # 报文构造推迟到真正被打印/记录时，抛出路径只存属性不拼字符串
+        return f"{self.message} (最大连接数: {self.max_connections})"
 
 class SQLQueryFailedError(LuckyChatDBError):
     """SQL查询执行失败异常"""
     def __init__(self, sql: str, params: tuple, message: str = "❌ SQL 查询失败"):
         self.sql = sql
         self.params = params
-        full_message = f"{message}（SQL: {sql}, params: {params}）"
-        super().__init__(full_message)
\ No newline at end of file
+        self.message = message
+        super().__init__()
+
+    def __str__(self) -> str:
+        # 同上：SQL文本+参数可能很长，只有异常被格式化时才拼接
+        return f"{self.message}（SQL: {self.sql}, params: {self.params}）"
\ No newline at end of file
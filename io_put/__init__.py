@@ -1,7 +1,26 @@
-from .config_loader import ConfigLoader
-from .dataclass_output import DataConverterFacade
-from .analyzer_result_saver import save_analyzer_result_to_json
+# PEP 562惰性导出：按属性名首次访问时才导入对应子模块，
+# 只用ConfigLoader的短命进程不必连带加载chat_analyzer/parser整条依赖链
+_LAZY_EXPORTS = {
+    "ConfigLoader": ("io_put.config_loader", "ConfigLoader"),
+    "DataConverterFacade": ("io_put.dataclass_output", "DataConverterFacade"),
+    "save_analyzer_result_to_json": ("io_put.analyzer_result_saver", "save_analyzer_result_to_json"),
+}
 
 __all__ = [
     "ConfigLoader", "DataConverterFacade", "save_analyzer_result_to_json"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    try:
+        module_name, attr_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    from importlib import import_module
+    attr = getattr(import_module(module_name), attr_name)
+    globals()[name] = attr  # 回填模块命名空间，后续访问不再走__getattr__
+    return attr
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
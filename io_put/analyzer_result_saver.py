@@ -35,16 +35,13 @@ def save_analyzer_result_to_json(analyzer_result: List[AnalyzerResult], app_conf
 
     # 拼接文件名（格式：导出路径/时间_关键词组合.json）
     filename = f"{current_time}_{phrase_suffix}.json"
-    # 组合完整文件路径
+    # 组合完整文件路径（输出目录由启动时ConfigParser.prepare_runtime保证存在，此处不重复makedirs）
     full_path = os.path.join(export_path, filename)
 
-    # 确保输出目录存在
-    os.makedirs(export_path, exist_ok=True)
-
     # 保存JSON文件
     DataConverterFacade.save_json(analyzer_result, full_path)
     
-    logger.info(f"✅ 分析结果已保存到：{full_path}")
+    logger.info("✅ 分析结果已保存到：%s", full_path)
     
     return full_path
 
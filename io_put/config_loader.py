@@ -3,6 +3,12 @@ import logging
 from pathlib import Path
 from typing import Dict
 
+# 可选依赖：orjson解析比stdlib json快数倍；未安装则回退stdlib（与dataclass_output一致）
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 导入自定义异常（根据实际路径调整）
 from exceptions import ParseBaseError
 
@@ -16,6 +22,11 @@ class ConfigLoader:
     # 默认配置文件路径（支持跨平台路径解析）
     DEFAULT_CONFIG_PATH = Path("./configs/config.json")
 
+    # 加载缓存：key=(路径, mtime_ns, 文件大小)，文件未变时跳过读取+JSON解析，只付一次stat开销
+    _load_cache: Dict[tuple, Dict] = {}
+    # 路径标准化缓存：resolve()涉及多次lstat/readlink系统调用，同一入参只做一次
+    _resolve_cache: Dict[str, Path] = {}
+
     @classmethod
     def load_config(cls, config_path: str = None) -> Dict:
         """
@@ -24,22 +35,37 @@ class ConfigLoader:
         :return: 解析后的配置字典
         :raise ParseBaseError: 路径/文件/格式异常时抛出统一异常
         """
-        # 1. 处理配置路径（优先自定义路径，无则用默认）
-        target_path = Path(config_path) if config_path else cls.DEFAULT_CONFIG_PATH
-        # 标准化路径（自动处理Windows反斜杠/相对路径）
-        target_path = target_path.resolve()
-        logger.info(f"✅ 开始加载配置文件，目标路径：{target_path}")
+        # 1. 处理配置路径（优先自定义路径，无则用默认；标准化结果按入参缓存，重复调用免系统调用）
+        resolve_key = config_path or str(cls.DEFAULT_CONFIG_PATH)
+        target_path = cls._resolve_cache.get(resolve_key)
+        if target_path is None:
+            # 标准化路径（自动处理Windows反斜杠/相对路径）
+            target_path = (Path(config_path) if config_path else cls.DEFAULT_CONFIG_PATH).resolve()
+            cls._resolve_cache[resolve_key] = target_path
+        logger.info("✅ 开始加载配置文件，目标路径：%s", target_path)
 
         try:
             # 2. 检查文件是否存在
             if not target_path.exists():
                 raise FileNotFoundError(f"⚠️ 配置文件不存在：{target_path}")
 
-            # 3. 读取并解析JSON
-            with open(target_path, "r", encoding="utf-8") as f:
-                config_dict = json.load(f)
+            # 2.5 缓存命中检查（mtime+大小未变则文件未改，直接复用上次解析结果）
+            stat_result = target_path.stat()
+            cache_key = (str(target_path), stat_result.st_mtime_ns, stat_result.st_size)
+            cached_dict = cls._load_cache.get(cache_key)
+            if cached_dict is not None:
+                logger.info("✅ 配置文件未变化，命中加载缓存（路径：%s）", target_path)
+                return cached_dict
+
+            # 3. 读取并解析JSON（orjson直接吃bytes；其JSONDecodeError是json.JSONDecodeError子类，下方except通吃）
+            if orjson is not None:
+                config_dict = orjson.loads(target_path.read_bytes())
+            else:
+                with open(target_path, "r", encoding="utf-8") as f:
+                    config_dict = json.load(f)
 
-            logger.info(f"✅ 配置文件加载成功（路径：{target_path}）")
+            cls._load_cache[cache_key] = config_dict
+            logger.info("✅ 配置文件加载成功（路径：%s）", target_path)
             return config_dict
 
         except FileNotFoundError as e:
@@ -51,6 +77,16 @@ class ConfigLoader:
         except Exception as e:
             raise ParseBaseError(f"⚠️ 配置文件加载失败：未知异常 → {e}") from e
 
+    @classmethod
+    def invalidate(cls, config_path: str = None) -> None:
+        """清空加载缓存（指定路径则只清该文件的条目，默认全清）"""
+        if config_path is None:
+            cls._load_cache.clear()
+            return
+        target = str(Path(config_path).resolve())
+        for key in [k for k in cls._load_cache if k[0] == target]:
+            del cls._load_cache[key]
+
     @classmethod
     def get_default_config_path(cls) -> str:
         """获取默认配置文件路径（标准化后）"""
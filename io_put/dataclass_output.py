@@ -4,8 +4,24 @@ import logging
 from enum import Enum
 from typing import Any, List
 
+# 可选依赖：orjson为C实现的JSON库，大结果集序列化比stdlib json快数倍；未安装则回退stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _orjson_default(obj: Any) -> Any:
+    """orjson原生序列化的兜底回调：dataclass由orjson在C层直接遍历，这里只补枚举和集合"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"无法序列化的类型：{type(obj).__name__}")
+
+
 class DataConverterFacade:
     """数据转换门面类（解除对AnalyzerResult的直接依赖）"""
 
@@ -35,9 +51,12 @@ class DataConverterFacade:
 
     @classmethod
     def to_json(cls, data_list: List[Any], indent: int = 2) -> str:
-        """将任意dataclass列表转换为JSON字符串"""
-        dict_list = cls.to_dict_list(data_list)
-        return json.dumps(dict_list, ensure_ascii=False, indent=indent)
+        """将任意dataclass列表转换为JSON字符串（优先orjson，非2缩进等场景回退stdlib）"""
+        if orjson is not None and indent == 2:
+            # orjson原生遍历dataclass（含slots），跳过_to_dict的逐节点Python递归；
+            # 输出utf-8 bytes且不转义中文，与ensure_ascii=False行为一致
+            return orjson.dumps(data_list, default=_orjson_default, option=orjson.OPT_INDENT_2).decode("utf-8")
+        return json.dumps(cls.to_dict_list(data_list), ensure_ascii=False, indent=indent)
 
     @classmethod
     def print_json(cls, data_list: List[Any], indent: int = 2) -> None:
@@ -46,12 +65,17 @@ class DataConverterFacade:
 
     @classmethod
     def log_json(cls, data_list: List[Any], indent: int = 2) -> None:
-        """日志打印转换后的JSON"""
-        logger.info(cls.to_json(data_list, indent))
+        """日志打印转换后的JSON（级别未启用时不做序列化）"""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(cls.to_json(data_list, indent))
 
     @classmethod
     def save_json(cls, data_list: List[Any], file_path: str, indent: int = 2) -> None:
-        """将JSON保存到文件"""
-        json_str = cls.to_json(data_list, indent)
+        """将JSON保存到文件（orjson可用时直接写bytes，省去一次decode/encode往返）"""
+        if orjson is not None and indent == 2:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(data_list, default=_orjson_default, option=orjson.OPT_INDENT_2))
+            return
+        # stdlib回退：json.dump流式写入文件，不在内存里先拼出完整JSON字符串
         with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(json_str)
+            json.dump(cls.to_dict_list(data_list), f, ensure_ascii=False, indent=indent)
@@ -15,10 +15,10 @@ from parser import AppConfig, ConfigParser  # 统一的应用配置模型（包
 from services import ContactDBService,ChatRecordDBService
 # 异常相关
 from exceptions import ParseBaseError, LuckyChatDBError, AnalyzerBaseException
-# # 策略工厂 + 接口
-from chat_analyzer import ChatRecordAnalyzer
 # 导入配置加载门面类
-from io_put import ConfigLoader, save_analyzer_result_to_json
+# 注：ChatRecordAnalyzer与save_analyzer_result_to_json推迟到使用处导入，
+# 配置/数据库初始化失败的错误路径不必付整条分析链的导入成本
+from io_put import ConfigLoader
 
 # ====================== 3. 核心异步主函数 ======================
 async def main():
@@ -32,26 +32,39 @@ async def main():
         config_dict = ConfigLoader.load_config()
         # 统一调用ConfigParser的parse方法（核心修正：替代逐个调用）
         app_config: AppConfig = ConfigParser.parse(config_dict)
+        # 执行配置相关的运行期副作用（创建输出目录等，解析本身保持纯校验）
+        ConfigParser.prepare_runtime(app_config)
         logger.info("✅ 所有配置统一解析完成")
 
         # -------------------------- 步骤2：初始化数据库 --------------------------
         logger.info("【步骤2/5】开始初始化数据库服务")
-        # 初始化聊天记录DB对象池
-        await ChatRecordDBService.init_pool(
-            db_path=app_config.db_config.chat_db_path,  # 替换为实际数据库路径
-            max_connections=10,
-            min_connections=3
+        # 两个库并发初始化：聊天记录池是异步预建连接，联系人同步单例丢到线程避免阻塞事件循环
+        # （gather沿用分析器的并发风格，首个异常原样上抛，外层按异常类分支不受影响）
+        await asyncio.gather(
+            # 初始化聊天记录DB对象池（池大小读配置，与max_concurrency匹配，不再写死）
+            ChatRecordDBService.init_pool(
+                db_path=app_config.db_config.chat_db_path,
+                max_connections=app_config.db_config.pool_max_connections,
+                min_connections=app_config.db_config.pool_min_connections
+            ),
+            # 初始化联系人DB单例
+            asyncio.to_thread(ContactDBService.init_instance, app_config.db_config.contact_db_path)
         )
-        logger.info(f"✅ 聊天记录异步数据对象池初始化成功（路径：{app_config.db_config.chat_db_path}）")
-
-        # 初始化联系人DB单例
-        ContactDBService.init_instance(app_config.db_config.contact_db_path)
-        logger.info(f"✅ 联系人同步单例数据库初始化成功（路径：{app_config.db_config.contact_db_path}）")
+        logger.info(
+            "✅ 聊天记录异步数据对象池初始化成功（路径：%s | 最小连接：%s | 最大连接：%s）",
+            app_config.db_config.chat_db_path,
+            app_config.db_config.pool_min_connections,
+            app_config.db_config.pool_max_connections
+        )
+        logger.info("✅ 联系人同步单例数据库初始化成功（路径：%s）", app_config.db_config.contact_db_path)
         logger.info("【步骤2/5】数据库服务初始化完成")
 
         # -------------------------- 步骤3：工厂创建策略实例 --------------------------
         logger.info("【步骤3/5】开始创建聊天记录分析实例")
 
+        # 惰性导入：走到这一步说明配置与数据库都已就绪
+        from chat_analyzer import ChatRecordAnalyzer
+
         analyzer = ChatRecordAnalyzer(app_config=app_config)
 
         logger.info(f"✅ 成功创建聊天记录分析实例")
@@ -62,21 +75,22 @@ async def main():
 
         # -------------------------- 步骤5：保存分析结果到JSON --------------------------
         logger.info("【步骤5/5】开始保存分析结果到JSON文件")
+        from io_put import save_analyzer_result_to_json
         saved_path = save_analyzer_result_to_json(analyzer_result, app_config)
-        logger.info(f"✅ 分析结果已保存到：{saved_path}")
+        logger.info("✅ 分析结果已保存到：%s", saved_path)
 
 
     except ParseBaseError as e:
-        logger.error(f"【配置解析/读取失败】{e}", exc_info=True)
+        logger.error("【配置解析/读取失败】%s", e, exc_info=True)
         sys.exit(1)
     except LuckyChatDBError as e:
-        logger.error(f"【数据库初始化失败】{e}", exc_info=True)
+        logger.error("【数据库初始化失败】%s", e, exc_info=True)
         sys.exit(1)
     except AnalyzerBaseException as e:
-        logger.error(f"【统计策略执行失败】{e}", exc_info=True)
+        logger.error("【统计策略执行失败】%s", e, exc_info=True)
         sys.exit(1)
     except Exception as e:
-        logger.error(f"【程序执行异常】未知错误：{e}", exc_info=True)
+        logger.error("【程序执行异常】未知错误：%s", e, exc_info=True)
         sys.exit(1)
     finally:
         # 关闭数据库连接
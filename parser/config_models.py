@@ -1,11 +1,12 @@
 from dataclasses import dataclass
+from datetime import date
 from typing import Optional, List
 
 
 # ------------------------------
 # 数据库配置
 # ------------------------------
-@dataclass
+@dataclass(slots=True)
 class DBConfig:
     chat_db_path: str  # 数据库文件路径（如 "Message.db"）
     contact_db_path: str  # 数据库文件路径（如 "Contact.db"）
@@ -17,28 +18,32 @@ class DBConfig:
 # ------------------------------
 # 统计模式配置
 # ------------------------------
-@dataclass
+@dataclass(slots=True)
 class StatModeConfig:
     mode_type: str  # self_all / self_to_target / target_to_self
     target_contact_list: Optional[List[str]] = None
+    only_self_msg: bool = True  # 解析期由mode_type折算：仅target_to_self查对方消息（ConfigParser填充）
 
 
 # ------------------------------
 # 时间配置
 # ------------------------------
-@dataclass
+@dataclass(slots=True)
 class TimeConfig:
     stat_dimension: str  # day / week / month
     time_range_type: str  # recent / custom
     recent_num: Optional[int] = None
     custom_start_date: Optional[str] = None
     custom_end_date: Optional[str] = None
+    # 解析期预转换的date对象（ConfigParser填充），下游SQLBuilder直接使用，免去重复strptime
+    custom_start: Optional[date] = None
+    custom_end: Optional[date] = None
 
 
 # ------------------------------
 # 口头禅配置
 # ------------------------------
-@dataclass
+@dataclass(slots=True)
 class PetPhraseConfig:
     pet_phrases: List[str]
     # case_sensitive: bool = False  # 是否大小写敏感
@@ -48,12 +53,17 @@ class PetPhraseConfig:
     # context_backtrack_limit: int = 3
     context_front_limit: int = 2
     context_end_limit:int = 2
+    # 解析期预构建的SQL片段（ConfigParser._parse_pet_phrase填充；配置不可变，常量折叠后run()直接复用）
+    sql_phrase_condition: str = ""
+    sql_phrase_params: tuple = ()
+    sql_match_keywords: str = ""
+    sql_match_params: tuple = ()
 
 
 # ------------------------------
 # 过滤配置
 # ------------------------------
-@dataclass
+@dataclass(slots=True)
 class FilterConfig:
     filter_group_chat: bool = True  # 是否过滤群聊
     # filter_msg_types: List[Literal["voice", "image", "video", "file", "location", "link"]] = None  # 过滤的消息类型
@@ -63,7 +73,7 @@ class FilterConfig:
 # ------------------------------
 # 输出配置
 # ------------------------------
-@dataclass
+@dataclass(slots=True)
 class OutputConfig:
     display_dimension: str  # 统计/可视化维度：year/month/day
     export_path: str        # 输出文件根路径
@@ -72,7 +82,7 @@ class OutputConfig:
 # ------------------------------
 # 应用总配置（整合所有子配置）
 # ------------------------------
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     db_config: DBConfig
     stat_mode: StatModeConfig
@@ -1,4 +1,5 @@
 import datetime
+import json
 import logging
 from typing import Dict
 import os
@@ -14,6 +15,18 @@ from exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# 解析结果缓存：同一配置字典重复解析（测试/监听重跑场景）直接复用，跳过全部校验与SQL预构建
+# 解析完成后AppConfig全程只读，返回同一实例是安全的
+_parse_cache: Dict[str, AppConfig] = {}
+
+# 校验用合法值常量（frozenset成员判断O(1)，模块加载时构建一次；报错文案用sorted保证展示顺序稳定）
+VALID_MODES = frozenset({"self_all", "self_to_target", "target_to_self"})
+TARGET_MODES = frozenset({"self_to_target", "target_to_self"})  # 需要target_contact_list的模式
+VALID_DIMENSIONS = frozenset({"day", "week", "month"})
+VALID_RANGE_TYPES = frozenset({"recent", "custom"})
+VALID_MATCH_TYPES = frozenset({"contains", "exact"})
+VALID_DISPLAY_DIMENSIONS = frozenset({"year", "month", "day"})
+
 # ------------------------------
 # 配置解析器（核心：校验+转换配置）
 # ------------------------------
@@ -23,7 +36,13 @@ class ConfigParser:
 
     @staticmethod
     def parse(config_dict: Dict) -> AppConfig:
-        """主解析方法：将原始JSON字典转换为结构化AppConfig"""
+        """主解析方法：将原始JSON字典转换为结构化AppConfig（命中缓存时直接返回）"""
+        cache_key = json.dumps(config_dict, sort_keys=True, ensure_ascii=False)
+        cached_config = _parse_cache.get(cache_key)
+        if cached_config is not None:
+            logger.info("✅ 配置解析命中缓存，跳过重复校验")
+            return cached_config
+
         db_config = ConfigParser._parse_db_config(config_dict.get("db_config", {}))
         stat_mode = ConfigParser._parse_stat_mode(config_dict.get("stat_mode", {}))
         time_config = ConfigParser._parse_time_config(config_dict.get("time_config", {}))
@@ -31,7 +50,7 @@ class ConfigParser:
         filter_cfg = ConfigParser._parse_filter(config_dict.get("filter_config", {}))
         output_cfg = ConfigParser._parse_output_config(config_dict.get("output_config", {}))
 
-        return AppConfig(
+        app_config = AppConfig(
             db_config=db_config,
             stat_mode=stat_mode,
             time_config=time_config,
@@ -39,6 +58,17 @@ class ConfigParser:
             filter_config=filter_cfg,
             output_config=output_cfg
         )
+        _parse_cache[cache_key] = app_config
+        return app_config
+
+
+    @staticmethod
+    def prepare_runtime(app_config: AppConfig) -> None:
+        """执行配置相关的运行期副作用（目前只有输出目录创建），与纯校验的parse分离"""
+        export_path = app_config.output_config.export_path
+        if not os.path.exists(export_path):
+            os.makedirs(export_path, exist_ok=True)
+            logger.info("📁 输出目录不存在，已自动创建：%s", export_path)
 
 
     @staticmethod
@@ -52,8 +82,10 @@ class ConfigParser:
         # 1.2 类型校验
         if not isinstance(chat_db_path, str):
             raise InvalidTypeError("db_config.chat_db_path 必须是字符串类型（聊天记录数据库文件路径）")
-        # 1.3 文件存在性校验
-        if not os.path.exists(chat_db_path):
+        # 1.3 文件存在性校验（os.stat单次系统调用替代exists，不存在直接走异常分支）
+        try:
+            os.stat(chat_db_path)
+        except FileNotFoundError:
             raise ParseFileNotFoundError(f"聊天记录数据库文件不存在：{chat_db_path}（请检查路径是否正确）")
 
         # ========== 2. 校验联系人DB路径（contact_db_path） ==========
@@ -64,8 +96,10 @@ class ConfigParser:
         # 2.2 类型校验
         if not isinstance(contact_db_path, str):
             raise InvalidTypeError("db_config.contact_db_path 必须是字符串类型（联系人数据库文件路径）")
-        # 2.3 文件存在性校验
-        if not os.path.exists(contact_db_path):
+        # 2.3 文件存在性校验（同上，stat替代exists）
+        try:
+            os.stat(contact_db_path)
+        except FileNotFoundError:
             raise ParseFileNotFoundError(f"联系人数据库文件不存在：{contact_db_path}（请检查路径是否正确）")
 
         # ========== 3. max_concurrency 校验（原有逻辑不变） ==========
@@ -117,11 +151,10 @@ class ConfigParser:
 
         # 解析mode_type并校验
         mode_type = stat_mode_dict.get("mode_type")
-        valid_modes = ["self_all", "self_to_target", "target_to_self"]
 
-        if not mode_type or mode_type not in valid_modes:
+        if not mode_type or mode_type not in VALID_MODES:
             # 2. 校验失败日志（ERROR级：记录错误原因，便于排查）
-            raise InvalidValueError(f"stat_mode.mode_type 必须是 {valid_modes} 中的一种")
+            raise InvalidValueError(f"stat_mode.mode_type 必须是 {sorted(VALID_MODES)} 中的一种")
 
         # 解析target_contact_list并校验
         target_contact_list = stat_mode_dict.get("target_contact_list")
@@ -133,11 +166,11 @@ class ConfigParser:
                     f"mode_type={mode_type} 时，target_contact_list 必须为空列表（[]），当前值：{target_contact_list}")
 
         # 后两种模式必须指定target_contact_list
-        if mode_type in ["self_to_target", "target_to_self"] and not target_contact_list:
+        if mode_type in TARGET_MODES and not target_contact_list:
             raise MissingRequiredFieldError(f"mode_type={mode_type} 时，必须填写 target_contact_list")
 
         # 核心合并校验：指定模式下target_contact_list必须是「非空列表」且「所有元素都是非空字符串」
-        if mode_type in ["self_to_target", "target_to_self"]:
+        if mode_type in TARGET_MODES:
             # 先校验是否为列表
             if not isinstance(target_contact_list, list):
                 raise InvalidTypeError("target_contact_list 必须为列表类型")
@@ -156,10 +189,11 @@ class ConfigParser:
                     f"target_contact_list 列表中所有元素必须是非空字符串，无效元素：{', '.join(invalid_elements)}"
                 )
 
-        # 构造返回对象
+        # 构造返回对象（only_self_msg解析期折算一次，运行期直接读字段）
         return StatModeConfig(
             mode_type=mode_type,
-            target_contact_list=target_contact_list
+            target_contact_list=target_contact_list,
+            only_self_msg=(mode_type != "target_to_self")
         )
 
 
@@ -170,15 +204,13 @@ class ConfigParser:
         """解析并校验时间配置，生成SQL可用条件"""
         # 1. 校验维度
         stat_dimension = time_config_dict.get("stat_dimension")
-        valid_dimensions = ["day", "week", "month"]
-        if not stat_dimension or stat_dimension not in valid_dimensions:
-            raise InvalidValueError(f"time_config.stat_dimension 必须是 {valid_dimensions} 中的一种")
+        if not stat_dimension or stat_dimension not in VALID_DIMENSIONS:
+            raise InvalidValueError(f"time_config.stat_dimension 必须是 {sorted(VALID_DIMENSIONS)} 中的一种")
 
         # 2. 校验时间范围类型
         time_range_type = time_config_dict.get("time_range_type")
-        valid_range_types = ["recent", "custom"]
-        if not time_range_type or time_range_type not in valid_range_types:
-            raise InvalidValueError(f"time_config.time_range_type 必须是 {valid_range_types} 中的一种")
+        if not time_range_type or time_range_type not in VALID_RANGE_TYPES:
+            raise InvalidValueError(f"time_config.time_range_type 必须是 {sorted(VALID_RANGE_TYPES)} 中的一种")
 
         # 3. 校验recent场景参数
         recent_num = time_config_dict.get("recent_num")
@@ -191,17 +223,18 @@ class ConfigParser:
         # 4. 校验custom场景参数
         custom_start_date = time_config_dict.get("custom_start_date")
         custom_end_date = time_config_dict.get("custom_end_date")
+        custom_start = custom_end = None
         if time_range_type == "custom":
             if not custom_start_date or not custom_end_date:
                 raise MissingRequiredFieldError("time_range_type=custom 时，必须填写 custom_start_date 和 custom_end_date")
-            # 校验日期格式
+            # 校验并预转换日期（fromisoformat走C快路径；date对象存入配置供下游复用，并按日期而非字符串比较）
             try:
-                datetime.datetime.strptime(custom_start_date, "%Y-%m-%d")
-                datetime.datetime.strptime(custom_end_date, "%Y-%m-%d")
-                if custom_start_date > custom_end_date:
-                    raise InvalidValueError("custom_start_date 不能晚于 custom_end_date")
+                custom_start = datetime.date.fromisoformat(custom_start_date)
+                custom_end = datetime.date.fromisoformat(custom_end_date)
             except ValueError as e:
                 raise DateFormatError(f"日期格式错误（需YYYY-MM-DD）：{e}")
+            if custom_start > custom_end:
+                raise InvalidValueError("custom_start_date 不能晚于 custom_end_date")
 
         # 初始化时间配置
         return TimeConfig(
@@ -209,7 +242,9 @@ class ConfigParser:
             time_range_type=time_range_type,
             recent_num=recent_num,
             custom_start_date=custom_start_date,
-            custom_end_date=custom_end_date
+            custom_end_date=custom_end_date,
+            custom_start=custom_start,
+            custom_end=custom_end
         )
 
     @staticmethod
@@ -227,10 +262,9 @@ class ConfigParser:
 
         # match_type 校验
         match_type = pet_phrase_dict.get("match_type", "contains").strip()
-        valid_match_types = ["contains", "exact"]
-        if match_type not in valid_match_types:
+        if match_type not in VALID_MATCH_TYPES:
             raise InvalidValueError(
-                f"pet_phrase_config.match_type 有效值为{valid_match_types}，当前值：{match_type}"
+                f"pet_phrase_config.match_type 有效值为{sorted(VALID_MATCH_TYPES)}，当前值：{match_type}"
             )
 
         # ========== 3. context_front_limit 校验（原有逻辑不变） ==========
@@ -279,7 +313,7 @@ class ConfigParser:
         # if not isinstance(ignore_emoji_space, bool):
         #     raise ValueError("pet_phrase_config.ignore_emoji_space 必须是布尔值（true/false）")
 
-        return PetPhraseConfig(
+        pet_phrase_config = PetPhraseConfig(
             pet_phrases=pet_phrases,
             match_type=match_type
             # case_sensitive=case_sensitive,
@@ -287,6 +321,16 @@ class ConfigParser:
             # ignore_emoji_space=ignore_emoji_space
         )
 
+        # 解析期预构建SQL片段（配置解析后不再变化，提前折叠避免每次run()重复拼接）
+        # 函数内导入：services.builder反向引用本包的配置类，模块级导入会形成循环依赖
+        from services.builder.sql_builder import SQLBuilder
+        pet_phrase_config.sql_phrase_condition, pet_phrase_config.sql_phrase_params = \
+            SQLBuilder.build_phrase_condition(pet_phrase_config)
+        pet_phrase_config.sql_match_keywords, pet_phrase_config.sql_match_params = \
+            SQLBuilder.build_match_keywords_sql(pet_phrase_config)
+
+        return pet_phrase_config
+
     @staticmethod
     def _parse_filter(filter_dict: Dict) -> FilterConfig:
         """解析过滤配置"""
@@ -319,20 +363,16 @@ class ConfigParser:
     def _parse_output_config(output_config_dict: Dict) -> OutputConfig:
         """校验并解析输出配置（极简版，仅处理display_dimension+export_path）"""
         # 1. 校验 display_dimension
-        valid_dimensions = ["year", "month", "day"]
         display_dimension = output_config_dict.get("display_dimension", "month")
-        if display_dimension not in valid_dimensions:
-            raise InvalidValueError(f"output_config.display_dimension 仅支持 {valid_dimensions}，当前值：{display_dimension}")
+        if display_dimension not in VALID_DISPLAY_DIMENSIONS:
+            raise InvalidValueError(f"output_config.display_dimension 仅支持 {sorted(VALID_DISPLAY_DIMENSIONS)}，当前值：{display_dimension}")
 
         # 2. 校验 export_path（默认值+路径合法性+自动创建）
         export_path = output_config_dict.get("export_path", "./output/")
         if not isinstance(export_path, str):
             raise InvalidTypeError("output_config.export_path 必须是字符串类型（文件输出路径）")
 
-        # 自动创建输出目录（不存在则创建）
-        if not os.path.exists(export_path):
-            os.makedirs(export_path, exist_ok=True)
-            logger.info("📁 输出目录不存在，已自动创建：%s",export_path)
+        # 注：目录创建属运行期副作用，移到prepare_runtime统一执行，保持解析纯校验（重复parse零系统调用）
 
         # 3. 返回解析后的 OutputConfig
         return OutputConfig(
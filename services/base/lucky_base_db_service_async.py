@@ -2,7 +2,7 @@ import asyncio
 import logging
 from abc import ABCMeta, abstractmethod
 from contextlib import asynccontextmanager
-from typing import Optional, List, Dict, Any, Type
+from typing import Optional, List, Dict, Any, AsyncIterator, Type
 
 import aiosqlite
 
@@ -74,6 +74,10 @@ class LuckyDBPoolServiceAsync(metaclass=ABCMeta):
             await conn.execute("PRAGMA query_only = 1")
             # 优化只读缓存（增大缓存大小，单位为页，默认4096，可根据内存调整）
             await conn.execute("PRAGMA cache_size = -20000")  # -表示KB，此处为20MB
+            # 内存映射读取（大表批量扫描走mmap页缓存，减少read系统调用，此处为256MB）
+            await conn.execute("PRAGMA mmap_size = 268435456")
+            # 临时表/排序中间结果放内存（避免大查询落盘临时文件）
+            await conn.execute("PRAGMA temp_store = MEMORY")
             # 禁用写日志（只读场景无需）
             await conn.execute("PRAGMA synchronous = OFF")
             # 关闭自动整理（只读无需）
@@ -220,10 +224,15 @@ class PooledConnection:
                 if not cursor.description:
                     return []
 
-                # 解析列名+结果
+                # 解析列名+结果（fetchmany分批取行，避免原始行与转换结果同时全量驻留内存）
                 columns = [desc[0] for desc in cursor.description]
-                rows = await cursor.fetchall()
-                result = [dict(zip(columns, row)) for row in rows]
+                result: List[Dict[str, Any]] = []
+                cursor.arraysize = 2000
+                while True:
+                    rows = await cursor.fetchmany(cursor.arraysize)
+                    if not rows:
+                        break
+                    result.extend(dict(zip(columns, row)) for row in rows)
 
             return result
 
@@ -232,6 +241,55 @@ class PooledConnection:
             error_msg = f"SQL执行失败 | SQL: {clean_sql} | 参数: {params} | 错误: {str(e)}"
             raise SQLQueryFailedError(sql, params, error_msg) from e
 
+    async def execute_query_rows(self, sql: str, params: Optional[tuple] = None) -> List[tuple]:
+        """
+        热路径专用：按列序返回原始元组行，跳过逐行dict构造
+        （大结果集下每行省去一次dict分配，列序由调用方SELECT语句约定）
+        """
+        # 1. 前置校验：连接是否有效
+        if not self.db_connection:
+            raise DBConnectionNotInitializedError("池化连接已关闭/未初始化")
+
+        # 2. 格式化SQL（日志友好）
+        clean_sql = " ".join(sql.strip().split())
+        params = params or ()
+
+        try:
+            async with self.db_connection.execute(clean_sql, params) as cursor:
+                return list(await cursor.fetchall())
+
+        except Exception as e:
+            error_msg = f"SQL执行失败 | SQL: {clean_sql} | 参数: {params} | 错误: {str(e)}"
+            raise SQLQueryFailedError(sql, params, error_msg) from e
+
+    async def iter_query_rows(
+            self, sql: str, params: Optional[tuple] = None, batch_size: int = 2000
+    ) -> AsyncIterator[tuple]:
+        """
+        流式版execute_query_rows：fetchmany分批产出原始元组行，
+        峰值内存仅一批行而非全量结果集（调用方需在连接持有期内消费完毕）
+        """
+        # 1. 前置校验：连接是否有效
+        if not self.db_connection:
+            raise DBConnectionNotInitializedError("池化连接已关闭/未初始化")
+
+        # 2. 格式化SQL（日志友好）
+        clean_sql = " ".join(sql.strip().split())
+        params = params or ()
+
+        try:
+            async with self.db_connection.execute(clean_sql, params) as cursor:
+                while True:
+                    rows = await cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield row
+
+        except Exception as e:
+            error_msg = f"SQL执行失败 | SQL: {clean_sql} | 参数: {params} | 错误: {str(e)}"
+            raise SQLQueryFailedError(sql, params, error_msg) from e
+
     async def is_valid(self) -> bool:
         """检查连接是否有效（使用 bool 返回值判断）"""
         return await self.test_db_connection()
@@ -44,8 +44,11 @@ class LuckyDBBaseServiceSync(metaclass=ABCMeta):
     def _init_db(cls, db_path: str):
         """类方法：初始化数据库连接（仅调用一次）"""
         try:
+            # 使用 URI 格式指定只读模式（mode=ro），与异步池的打开方式保持一致：
+            # 文件层面禁止写入，跳过写锁检查，页缓存可当作纯读缓存使用
             cls._db_connection = sqlite3.connect(
-                db_path,
+                f"file:{db_path}?mode=ro",
+                uri=True,
                 check_same_thread=False
             )
             cls._db_connection.execute("PRAGMA foreign_keys = ON")
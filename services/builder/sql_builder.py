@@ -1,17 +1,27 @@
+import calendar
 import datetime
 from typing import Tuple
 
 from parser import TimeConfig, PetPhraseConfig
 
 
+def _shift_months_back(now: datetime.datetime, months: int) -> datetime.datetime:
+    """按日历回退months个月（stdlib实现，不引入dateutil）；日期超出目标月天数时收缩到月末"""
+    year, month = divmod(now.year * 12 + (now.month - 1) - months, 12)
+    month += 1
+    day = min(now.day, calendar.monthrange(year, month)[1])
+    return now.replace(year=year, month=month, day=day)
+
+
 class SQLBuilder:
     """SQL生成工具类：仅接收合法配置，生成SQL片段，不做任何校验"""
 
     @staticmethod
-    def build_time_condition(time_config: TimeConfig) -> str:
+    def build_time_condition(time_config: TimeConfig) -> Tuple[str, tuple]:
         """
-        根据已校验的TimeConfig生成时间过滤SQL片段
+        根据已校验的TimeConfig生成时间过滤SQL片段+参数（参数化，便于语句缓存复用）
         前提：TimeConfig已通过ConfigParser校验，参数均合法
+        :return: (时间条件字符串, 参数元组)
         """
         now = datetime.datetime.now()
         end_date = now
@@ -26,17 +36,18 @@ class SQLBuilder:
                 case "week":
                     start_date = now - datetime.timedelta(weeks=recent_num)
                 case "month":
-                    start_date = now - datetime.timedelta(days=recent_num * 30)
+                    # 日历精确回退，替代"每月30天"的近似（31天月/2月会产生漂移）
+                    start_date = _shift_months_back(now, recent_num)
 
-        # 2. 处理custom场景（无需校验，ConfigParser已确保日期合法）
+        # 2. 处理custom场景（直接取解析期预转换的date对象，不再重复strptime）
         elif time_config.time_range_type == "custom":
-            start_date = datetime.datetime.strptime(time_config.custom_start_date, "%Y-%m-%d")
-            end_date = datetime.datetime.strptime(time_config.custom_end_date, "%Y-%m-%d")
+            start_date = datetime.datetime.combine(time_config.custom_start, datetime.time.min)
+            end_date = datetime.datetime.combine(time_config.custom_end, datetime.time.min)
 
-        # 3. 转换为unix时间戳，拼接SQL
+        # 3. 转换为unix时间戳，占位符参数化（避免每次生成不同SQL文本，无法复用预编译计划）
         start_timestamp = int(start_date.timestamp())
         end_timestamp = int(end_date.timestamp())
-        return f"create_time BETWEEN {start_timestamp} AND {end_timestamp}"
+        return "create_time BETWEEN ? AND ?", (start_timestamp, end_timestamp)
 
 
     @staticmethod
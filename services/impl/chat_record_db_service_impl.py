@@ -1,5 +1,6 @@
 import logging
-from typing import List, Dict, Any, Iterable, Set
+from functools import lru_cache
+from typing import List, Dict, Any, AsyncIterator, Iterable, Set
 
 import aiosqlite
 
@@ -8,6 +9,42 @@ from ..base.lucky_base_db_service_async import LuckyDBPoolServiceAsync
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=64)
+def _build_chat_records_sql(
+        table_name: str,
+        phrase_condition: str,
+        match_keywords_sql: str,
+        time_condition: str,
+        only_self_msg: bool
+) -> str:
+    """
+    拼接聊天记录查询SQL（lru_cache缓存：同一轮运行各条件固定，仅表名变化，
+    避免每次调用重复做字符串拼接/格式化）
+    """
+    # 1. 构建SELECT字段（动态追加match_keywords）
+    select_fields = ["local_id", "message_content", "real_sender_id", "create_time", match_keywords_sql]
+    select_sql = ", ".join(select_fields)
+
+    # 2. 构建WHERE条件（过滤空字符串，避免AND连接空条件导致语法错误）
+    where_conditions = [
+        "local_type = 1",
+        "real_sender_id = 1" if only_self_msg else "real_sender_id != 1",
+        time_condition,
+        phrase_condition
+    ]
+    # 过滤空条件（比如phrase_condition为空时，移除该元素）
+    where_conditions = [cond for cond in where_conditions if cond.strip()]
+    where_sql = " AND ".join(where_conditions)
+
+    # 3. 拼接完整SQL（格式化，去除多余空格）
+    base_sql = f"""
+                SELECT {select_sql}
+                FROM {table_name}
+                WHERE {where_sql}
+            """
+    return " ".join(base_sql.split())  # 格式化SQL，去除换行/多余空格
+
 class ChatRecordDBService(LuckyDBPoolServiceAsync):
     """聊天记录数据库服务"""
 
@@ -66,53 +103,35 @@ class ChatRecordDBService(LuckyDBPoolServiceAsync):
             match_keywords_sql: str,
             match_params: tuple,
             time_condition: str,
+            time_params: tuple,
             only_self_msg: bool
-    ) -> List[Dict[str, Any]]:
+    ) -> AsyncIterator[tuple]:
         """
-        根据关键词配置和时间配置查询指定Msg表的纯文字聊天记录
-        :param time_condition: 预构建的时间条件
+        根据关键词配置和时间配置流式查询指定Msg表的纯文字聊天记录（异步生成器）
+        :param time_condition: 预构建的时间条件（占位符形式）
+        :param time_params: 预构建的时间条件参数
         :param phrase_params: 预构建的口头禅参数
         :param phrase_condition: 预构建的口头禅条件
         :param match_keywords_sql: 可选，命中关键词拼接的SQL片段（来自build_match_keywords_sql）
         :param match_params: 可选，命中关键词的参数元组（来自build_match_keywords_sql）
         :param table_name: 目标Msg表名（如Msg_123456abc）
         :param only_self_msg: 必填，True=仅查询自己发送的消息（real_sender_id=1），False=仅查询非自己发送的消息（real_sender_id≠1）
-        :return: 符合条件的聊天记录列表，每条记录包含：
-            local_id、message_content、real_sender_id、create_time 等关键字段
-            传入match_keywords_sql则额外包含match_keywords字段
+        :return: 逐行产出符合条件的聊天记录元组（分批流式读取，不全量驻留内存），列序固定为：
+            (local_id, message_content, real_sender_id, create_time, matched_phrases)
         """
 
-        # 1. 构建SELECT字段（动态追加match_keywords）
-        select_fields = ["local_id", "message_content", "real_sender_id", "create_time", match_keywords_sql]
-        select_sql = ", ".join(select_fields)
-
-        # 2. 构建WHERE条件（过滤空字符串，避免AND连接空条件导致语法错误）
-        where_conditions = [
-            "local_type = 1",
-            "real_sender_id = 1" if only_self_msg else "real_sender_id != 1",
-            time_condition,
-            phrase_condition
-        ]
-        # 过滤空条件（比如phrase_condition为空时，移除该元素）
-        where_conditions = [cond for cond in where_conditions if cond.strip()]
-        where_sql = " AND ".join(where_conditions)
-
-        # 3. 拼接完整SQL（格式化，去除多余空格）
-        base_sql = f"""
-                    SELECT {select_sql}
-                    FROM {table_name}
-                    WHERE {where_sql}
-                """
-        base_sql = " ".join(base_sql.split())  # 格式化SQL，去除换行/多余空格
-
-        # 4. 合并参数（口头禅参数 + 命中关键词参数）
-        all_params = match_params + phrase_params
-
-        # 5. 异步执行查询
-        async with cls.acquire_connection() as conn:
-            raw_records = await conn.execute_query(base_sql, all_params)
+        # 1~3. 拼接完整SQL（lru_cache缓存模板，重复调用直接命中）
+        base_sql = _build_chat_records_sql(
+            table_name, phrase_condition, match_keywords_sql, time_condition, only_self_msg
+        )
 
-        return raw_records
+        # 4. 合并参数（命中关键词参数 + 时间参数 + 口头禅参数，顺序与SELECT/WHERE占位符一致）
+        all_params = match_params + time_params + phrase_params
+
+        # 5. 流式执行查询（连接在消费完毕前持有，fetchmany分批产出元组行）
+        async with cls.acquire_connection() as conn:
+            async for row in conn.iter_query_rows(base_sql, all_params):
+                yield row
 
 
     @classmethod
@@ -149,3 +168,40 @@ class ChatRecordDBService(LuckyDBPoolServiceAsync):
 
         return raw_records
 
+
+    @classmethod
+    async def get_records_by_local_id_ranges(
+            cls,
+            table_name: str,
+            id_ranges: List[tuple]
+    ) -> List[Dict[str, Any]]:
+        """
+        按local_id区间批量查询聊天记录
+        每个区间走主键BETWEEN范围扫描，参数量从每ID一个降为每区间两个，
+        回溯上下文这类连续ID场景优于超长IN列表
+        :param table_name: 表名
+        :param id_ranges: (起始local_id, 结束local_id)闭区间列表（调用方需保证已归并去重）
+        """
+
+        # 空区间列表直接返回，避免SQL语法错误（WHERE后无条件非法）
+        if not id_ranges:
+            return []
+
+        # 构建区间查询SQL（OR连接的BETWEEN，每个区间都命中主键索引范围扫描）
+        range_condition = " OR ".join(["local_id BETWEEN ? AND ?"] * len(id_ranges))
+        sql = f"""
+                SELECT local_id, real_sender_id, create_time,
+                    CASE
+                        WHEN local_type = 1 THEN message_content
+                        ELSE '[非文本消息类型暂且无法展示]'
+                    END AS message_content
+                FROM {table_name}
+                WHERE {range_condition}
+            """
+
+        params = tuple(bound for id_range in id_ranges for bound in id_range)
+        async with cls.acquire_connection() as conn:
+            raw_records = await conn.execute_query(sql, params)
+
+        return raw_records
+